@@ -178,8 +178,9 @@ class DigitClassificationDataset(Dataset):
             self.dev_labels = test_labels[0::2]
             self.test_images = test_images[1::2]
             self.test_labels = test_labels[1::2]
+        self.dev_images_node = nn.Constant(self.dev_images)
 
-        train_labels_one_hot = np.zeros((len(train_images), 10))
+        train_labels_one_hot = np.zeros((len(train_images), 10), dtype=np.float32)
         train_labels_one_hot[range(len(train_images)), train_labels] = 1
 
         super().__init__(train_images, train_labels_one_hot)
@@ -234,7 +235,7 @@ class DigitClassificationDataset(Dataset):
             yield x, y
 
             if use_graphics and time.time() - self.last_update > 1:
-                dev_logits = self.model.run(nn.Constant(self.dev_images)).data
+                dev_logits = self.model.run(self.dev_images_node).data
                 dev_predicted = np.argmax(dev_logits, axis=1)
                 dev_probs = np.exp(nn.SoftmaxLoss.log_softmax(dev_logits))
                 dev_accuracy = np.mean(dev_predicted == self.dev_labels)
@@ -267,7 +268,7 @@ class DigitClassificationDataset(Dataset):
                 self.last_update = time.time()
 
     def get_validation_accuracy(self):
-        dev_logits = self.model.run(nn.Constant(self.dev_images)).data
+        dev_logits = self.model.run(self.dev_images_node).data
         dev_predicted = np.argmax(dev_logits, axis=1)
         dev_accuracy = np.mean(dev_predicted == self.dev_labels)
         return dev_accuracy
@@ -343,9 +344,9 @@ alphabet above have been substituted with ASCII symbols.""".strip())
                 break
             assert not np.any(inp_x[:,i] == -1), (
                 "Please report this error in the project: batching by length was done incorrectly in the provided code")
-            x = np.eye(len(self.chars))[inp_x[:,i]]
+            x = np.eye(len(self.chars), dtype=np.float32)[inp_x[:,i]]
             xs.append(nn.Constant(x))
-        y = np.eye(len(self.language_names))[inp_y]
+        y = np.eye(len(self.language_names), dtype=np.float32)[inp_y]
         y = nn.Constant(y)
         return xs, y
 
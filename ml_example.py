@@ -100,9 +100,11 @@ def main():
 
     questions = set()
     maxes = {}
+    tests_by_q = {}
     for q, points, fn in TESTS:
         questions.add(q)
         maxes[q] = maxes.get(q, 0) + points
+        tests_by_q.setdefault(q, []).append((points, fn))
         if q not in PREREQS:
             PREREQS[q] = set()
 
@@ -113,9 +115,7 @@ def main():
         if not started:
             continue
 
-        for testq, points, fn in TESTS:
-            if testq != q:
-                continue
+        for points, fn in tests_by_q.get(q, ()):
             try:
                 fn(tracker)
             except KeyboardInterrupt:
@@ -139,6 +139,9 @@ import backend
 def check_dependencies():
     import matplotlib.pyplot as plt
     import time
+    if not backend.use_graphics:
+        return
+
     fig, ax = plt.subplots(1, 1)
     ax.set_xlim([-1, 1])
     ax.set_ylim([-1, 1])
@@ -186,27 +189,31 @@ def verify_node(node, expected_type, expected_shape, method_name):
         assert False, "If you see this message, please report a bug in the autograder"
 
     if expected_type != 'loss':
-        assert all([(expected == '?' or actual == expected) for (actual, expected) in zip(node.data.shape, expected_shape)]), (
+        assert all(expected == '?' or actual == expected for actual, expected in zip(node.data.shape, expected_shape)), (
             "{} should return an object with shape {}, got {}".format(
                 method_name, nn.format_shape(expected_shape), nn.format_shape(node.data.shape)))
 
 def trace_node(node_to_trace):
     """
-    Returns a set containing the node and all ancestors in the computation graph
+    Returns a dict mapping id(node) to node for the node and all ancestors in
+    the computation graph, and a frozenset of the nn.Parameter nodes among them
     """
-    nodes = set()
+    nodes = {}
     tape = []
 
-    def visit(node):
-        if node not in nodes:
-            for parent in node.parents:
-                visit(parent)
-            nodes.add(node)
+    stack = [(node_to_trace, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
             tape.append(node)
+        elif id(node) not in nodes:
+            nodes[id(node)] = node
+            stack.append((node, True))
+            for parent in reversed(node.parents):
+                stack.append((parent, False))
 
-    visit(node_to_trace)
-
-    return nodes
+    params = frozenset(node for node in tape if isinstance(node, nn.Parameter))
+    return nodes, params
 
 
 @test('q3', points=6)
@@ -215,34 +222,32 @@ def check_digit_classification(tracker):
     model = models.DigitClassificationModel()
     dataset = backend.DigitClassificationDataset(model)
 
+    batches = [
+        (batch_size, nn.Constant(dataset.x[:batch_size]), nn.Constant(dataset.y[:batch_size]))
+        for batch_size in (1, 2, 4)]
+
     detected_parameters = None
-    for batch_size in (1, 2, 4):
-        inp_x = nn.Constant(dataset.x[:batch_size])
-        inp_y = nn.Constant(dataset.y[:batch_size])
+    for batch_size, inp_x, _ in batches:
         output_node = model.run(inp_x)
         verify_node(output_node, 'node', (batch_size, 10), "DigitClassificationModel.run()")
-        trace = trace_node(output_node)
-        assert inp_x in trace, "Node returned from DigitClassificationModel.run() does not depend on the provided input (x)"
+        trace, params = trace_node(output_node)
+        assert id(inp_x) in trace, "Node returned from DigitClassificationModel.run() does not depend on the provided input (x)"
 
         if detected_parameters is None:
-            detected_parameters = [node for node in trace if isinstance(node, nn.Parameter)]
+            detected_parameters = params
 
-        for node in trace:
-            assert not isinstance(node, nn.Parameter) or node in detected_parameters, (
-                "Calling DigitClassificationModel.run() multiple times should always re-use the same parameters, but a new nn.Parameter object was detected")
+        assert params <= detected_parameters, (
+            "Calling DigitClassificationModel.run() multiple times should always re-use the same parameters, but a new nn.Parameter object was detected")
 
-    for batch_size in (1, 2, 4):
-        inp_x = nn.Constant(dataset.x[:batch_size])
-        inp_y = nn.Constant(dataset.y[:batch_size])
+    for batch_size, inp_x, inp_y in batches:
         loss_node = model.get_loss(inp_x, inp_y)
         verify_node(loss_node, 'loss', None, "DigitClassificationModel.get_loss()")
-        trace = trace_node(loss_node)
-        assert inp_x in trace, "Node returned from DigitClassificationModel.get_loss() does not depend on the provided input (x)"
-        assert inp_y in trace, "Node returned from DigitClassificationModel.get_loss() does not depend on the provided labels (y)"
+        trace, params = trace_node(loss_node)
+        assert id(inp_x) in trace, "Node returned from DigitClassificationModel.get_loss() does not depend on the provided input (x)"
+        assert id(inp_y) in trace, "Node returned from DigitClassificationModel.get_loss() does not depend on the provided labels (y)"
 
-        for node in trace:
-            assert not isinstance(node, nn.Parameter) or node in detected_parameters, (
-                "DigitClassificationModel.get_loss() should not use additional parameters not used by DigitClassificationModel.run()")
+        assert params <= detected_parameters, (
+            "DigitClassificationModel.get_loss() should not use additional parameters not used by DigitClassificationModel.run()")
 
     tracker.add_points(2) # Partial credit for passing sanity checks
 
@@ -47,15 +47,19 @@ class PerceptronModel(object):
         Train the perceptron until convergence.
         """
         "*** YOUR CODE HERE ***"
-        flag = True
-        while (flag):
-            for x, y in dataset.iterate_once(1):
-                if nn.as_scalar(y) != self.get_prediction(x):
-                    flag = False
-                    nn.Parameter.update(self.w, x, nn.as_scalar(y))
-            if (flag):
-                break
-            flag = True
+        for _ in range(100000):
+            for x, y in dataset.iterate_once(dataset.x.shape[0]):
+                x = x.data
+                y = y.data
+                scores = numpy.dot(x, self.w.data.T)
+                predictions = numpy.where(scores >= 0, 1.0, -1.0)
+                misses = numpy.where(predictions != y)[0]
+                if (misses.size == 0):
+                    return
+                for i in misses:
+                    score = numpy.dot(x[i], self.w.data[0])
+                    if (1.0 if score >= 0 else -1.0) != y[i, 0]:
+                        self.w.update(nn.Constant(x[i:i + 1]), float(y[i, 0]))
 
 
 class RegressionModel(object):
@@ -105,14 +109,15 @@ class RegressionModel(object):
         Trains the model.
         """
         "*** YOUR CODE HERE ***"
-        while (True):
-            for x, y in dataset.iterate_once(1):
-                g = nn.gradients(self.get_loss(x, y), [self.w0, self.w1, self.b0, self.b1])
-                self.w0.update(g[0], -0.005)
-                self.w1.update(g[1], -0.005)
-                self.b0.update(g[2], -0.005)
-                self.b1.update(g[3], -0.005)
-            if (nn.as_scalar(self.get_loss(nn.Constant(dataset.x), nn.Constant(dataset.y))) < 0.02):
+        all_x = nn.Constant(dataset.x)
+        all_y = nn.Constant(dataset.y)
+        params = [self.w0, self.w1, self.b0, self.b1]
+        for _ in range(20000):
+            for x, y in dataset.iterate_once(50):
+                g = nn.gradients(self.get_loss(x, y), params)
+                for p, d in zip(params, g):
+                    p.update(d, -0.01)
+            if (nn.as_scalar(self.get_loss(all_x, all_y)) < 0.02):
                 return 
 
 
@@ -182,15 +187,14 @@ class DigitClassificationModel(object):
         Trains the model.
         """
         "*** YOUR CODE HERE ***"
-        while (True):
-            for x, y in dataset.iterate_once(1):
-                g = nn.gradients(self.get_loss(x, y), [self.w0, self.w1, self.b0, self.b1])
-                self.w0.update(g[0], -0.005)
-                self.w1.update(g[1], -0.005)
-                self.b0.update(g[2], -0.005)
-                self.b1.update(g[3], -0.005)
+        params = [self.w0, self.w1, self.b0, self.b1]
+        for _ in range(100):
+            for x, y in dataset.iterate_once(100):
+                g = nn.gradients(self.get_loss(x, y), params)
+                for p, d in zip(params, g):
+                    p.update(d, -0.1)
                 
-            if (dataset.get_validation_accuracy() > 1):
+            if (dataset.get_validation_accuracy() >= 0.975):
                 return
 
 class LanguageIDModel(object):
@@ -214,7 +218,6 @@ class LanguageIDModel(object):
         self.w = nn.Parameter(47, 400)
         self.b0 = nn.Parameter(1, 400)
         self.wHidden = nn.Parameter(400, 400)
-        self.b1 = nn.Parameter(1, 400)
         self.wFinal = nn.Parameter(400, 5)
         self.b2 = nn.Parameter(1, 5)
     
@@ -249,18 +252,13 @@ class LanguageIDModel(object):
                 (also called logits)
         """
         "*** YOUR CODE HERE ***"
-        flag = True 
-        for x in xs:
-            xm0 = nn.Linear(x, self.w)
-            r0 = nn.ReLU(nn.AddBias(xm0, self.b0)) 
-            xm1 = nn.Linear(r0, self.wHidden) 
-            r1 = nn.ReLU(nn.AddBias(xm1, self.b1))
-            if flag:
-                ans = r1
-                flag = False
-            else:
-                ans = nn.Add(nn.AddBias(xm1, self.b1), nn.Linear(nn.ReLU(ans), self.wHidden))
-        return nn.AddBias(nn.Linear(nn.ReLU(ans), self.wFinal), self.b2)
+        # Input projections stay per-character: slicing one stacked projection
+        # makes every slice backpropagate a full (L*batch)-row gradient.
+        h = nn.ReLU(nn.AddBias(nn.Linear(xs[0], self.w), self.b0))
+        for x in xs[1:]:
+            z = nn.Add(nn.Linear(x, self.w), nn.Linear(h, self.wHidden))
+            h = nn.ReLU(nn.AddBias(z, self.b0))
+        return nn.AddBias(nn.Linear(h, self.wFinal), self.b2)
 
 
     def get_loss(self, xs, y):
@@ -285,14 +283,11 @@ class LanguageIDModel(object):
         Trains the model.
         """
         "*** YOUR CODE HERE ***"
-        while (True):
-            for x, y in dataset.iterate_once(2):
-                g = nn.gradients(self.get_loss(x, y), [self.w, self.wHidden, self.wFinal, self.b0, self.b1, self.b2])
-                self.w.update(g[0], -0.005)
-                self.wHidden.update(g[1], -0.005)
-                self.wFinal.update(g[2], -0.005)
-                self.b0.update(g[3], -0.005)
-                self.b1.update(g[4], -0.005)
-                self.b2.update(g[5], -0.005)
+        params = [self.w, self.wHidden, self.wFinal, self.b0, self.b2]
+        for _ in range(100):
+            for x, y in dataset.iterate_once(100):
+                g = nn.gradients(self.get_loss(x, y), params)
+                for p, d in zip(params, g):
+                    p.update(d, -0.05)
             if (dataset.get_validation_accuracy() >= 0.86):
                 return
@@ -38,7 +38,8 @@ class Parameter(DataNode):
         assert all(isinstance(dim, int) and dim > 0 for dim in shape), (
             "Shape must consist of positive integers, got {!r}".format(shape))
         limit = np.sqrt(3.0 / np.mean(shape))
-        data = np.random.uniform(low=-limit, high=limit, size=shape)
+        data = np.random.uniform(low=-limit, high=limit, size=shape).astype(
+            np.float32)
         super().__init__(data)
 
     def update(self, direction, multiplier):